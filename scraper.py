@@ -9,19 +9,56 @@ steps.
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import gzip
+import hashlib
+import http.client
 import json
 import logging
+import os
 import pathlib
 import sys
+import tempfile
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional
-from urllib import error, request
+from email.message import Message
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib import error, parse, request
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+# ``orjson`` is considerably faster than the standard library at both parsing
+# and serialising JSON. It is optional: when unavailable we fall back to
+# :mod:`json` with equivalent output (UTF-8, two-space indentation).
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
 @dataclass
 class SourceConfig:
     """Configuration for a single startup source.
@@ -31,6 +68,9 @@ class SourceConfig:
         url: HTTP(S) endpoint containing startup dealflow information.
         parser: Callable that converts raw HTTP responses into python
             dictionaries following the :func:`normalise_deal` input schema.
+            It receives the response body as UTF-8 encoded ``bytes`` (not
+            ``str``); call ``body.decode("utf-8")`` first if the parser needs
+            text, e.g. for ``str`` regular expressions.
         notes: Optional text describing the source. Helpful when onboarding new
             team members or when the source requires extra context (authentication,
             rate limits, etc.).
@@ -38,41 +78,303 @@ class SourceConfig:
 
     name: str
     url: str
-    parser: Callable[[str, "SourceConfig"], Iterable[Dict[str, Any]]]
+    parser: Callable[[bytes, "SourceConfig"], Iterable[Dict[str, Any]]]
     notes: Optional[str] = None
 
 
-def fetch_url(url: str, *, timeout: int = 10) -> str:
-    """Retrieve raw text from a URL.
+# Pooled keep-alive connections keyed by ``(scheme, host, port)``. Reusing a
+# connection skips the TCP and TLS handshakes, which dominate the latency of
+# small payloads. A connection is removed from the pool while in use and put
+# back once its response has been fully read.
+_CONN_POOL: Dict[Tuple[str, str, int], http.client.HTTPConnection] = {}
+
+_REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "vaireo-scraper",
+}
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+def _acquire_connection(key: Tuple[str, str, int], timeout: int) -> http.client.HTTPConnection:
+    """Return a pooled connection for ``key`` or open a new one."""
+
+    conn = _CONN_POOL.pop(key, None)
+    if conn is None:
+        scheme, host, port = key
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, port, timeout=timeout)
+
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _release_connection(key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+    """Return ``conn`` to the pool, closing it if another one is already pooled."""
+
+    if _CONN_POOL.setdefault(key, conn) is not conn:
+        conn.close()
+
+
+@atexit.register
+def _close_pooled_connections() -> None:
+    """Close every pooled connection (registered to run at interpreter exit)."""
+
+    while _CONN_POOL:
+        _, conn = _CONN_POOL.popitem()
+        conn.close()
+
+
+def _exchange(
+    key: Tuple[str, str, int], conn: http.client.HTTPConnection, target: str, headers: Dict[str, str]
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """Send a GET request over ``conn`` and read the full response."""
+
+    try:
+        conn.request("GET", target, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+    except BaseException:
+        conn.close()
+        raise
+
+    if response.will_close:
+        conn.close()
+    else:
+        _release_connection(key, conn)
+    return response.status, response.msg, body
+
+
+def _urlopen_get(url: str, timeout: int, headers: Dict[str, str]) -> Tuple[int, Message, bytes]:
+    """Perform a GET request through a :mod:`urllib.request` opener.
+
+    Used for requests the connection pool does not handle: non-HTTP schemes
+    such as ``file://`` and hosts that must be reached through a proxy
+    configured in the environment. Error statuses are returned rather than
+    raised so callers can treat both request paths alike.
+    """
+
+    # A fresh opener picks up the current proxy environment, matching the
+    # decision made by :func:`_uses_proxy`; ``urlopen`` caches its opener.
+    try:
+        with request.build_opener().open(request.Request(url, headers=headers), timeout=timeout) as response:
+            return getattr(response, "status", None) or 200, response.headers, response.read()
+    except error.HTTPError as exc:
+        with exc:
+            return exc.code, exc.headers, exc.read()
+
+
+def _uses_proxy(scheme: str, netloc: str) -> bool:
+    """Return ``True`` when the environment routes ``scheme://netloc`` via a proxy."""
+
+    return scheme in request.getproxies() and not request.proxy_bypass(netloc.rpartition("@")[2])
+
+
+def _get(url: str, timeout: int, headers: Dict[str, str]) -> Tuple[int, Message, bytes]:
+    """Perform a single GET request over a pooled connection.
+
+    A pooled connection may have been closed by the server since its last use;
+    in that case the request is retried once on a fresh connection. Proxied
+    and non-HTTP URLs are delegated to :func:`_urlopen_get` instead.
+    """
+
+    parts = parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname or _uses_proxy(scheme, parts.netloc):
+        return _urlopen_get(url, timeout, headers)
+
+    key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+
+    conn = _acquire_connection(key, timeout)
+    reused = conn.sock is not None
+    try:
+        return _exchange(key, conn, target, headers)
+    except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+        if not reused:
+            raise
+        LOGGER.debug("Pooled connection to %s was closed; retrying", parts.hostname)
+    return _exchange(key, _acquire_connection(key, timeout), target, headers)
+
+
+def fetch_url(url: str, *, timeout: int = 10, cache_dir: Optional[pathlib.Path] = None) -> bytes:
+    """Retrieve the raw response body from a URL.
+
+    Connections are kept alive and reused for subsequent requests to the same
+    host, and gzip or deflate compressed responses are decompressed. Requests
+    that go through a proxy configured via ``HTTP_PROXY``/``HTTPS_PROXY`` (see
+    :func:`urllib.request.getproxies`) and non-HTTP URLs such as ``file://``
+    are handled by :mod:`urllib` and do not reuse connections.
 
     Parameters
     ----------
     url:
-        The URL to fetch. HTTP redirects are handled transparently by
-        :mod:`urllib`.
+        The URL to fetch. HTTP redirects are followed transparently.
     timeout:
         Timeout for the request in seconds.
+    cache_dir:
+        Optional directory used to cache responses that carry an ``ETag`` or
+        ``Last-Modified`` header. Later requests for the same URL are made
+        conditional and the cached body is returned when the server answers
+        ``304 Not Modified``. Caching is disabled when ``None``.
 
     Returns
     -------
-    str
-        Text response body from the request. An empty string is returned if the
-        request fails, allowing the orchestrator to proceed with other sources
-        without raising an exception.
+    bytes
+        Response body from the request, left undecoded so the JSON parser can
+        consume it directly. Bodies declared in a charset other than UTF-8 are
+        transcoded to UTF-8. An empty bytes object is returned if the request
+        fails, allowing the orchestrator to proceed with other sources without
+        raising an exception.
     """
 
+    requested_url = url
+    cached = _read_cache(cache_dir, url) if cache_dir else None
+    request_headers = dict(_REQUEST_HEADERS)
+    if cached:
+        request_headers.update(_conditional_headers(cached[1]))
+
+    try:
+        for _ in range(_MAX_REDIRECTS + 1):
+            LOGGER.debug("Fetching URL %s", url)
+            status, headers, body = _get(url, timeout, request_headers)
+            location = headers.get("Location")
+            if status not in _REDIRECT_STATUSES or not location:
+                break
+            url = parse.urljoin(url, location)
+            # Like urllib's HTTPRedirectHandler, never let a remote source
+            # redirect to a local resource such as a ``file://`` URL.
+            if parse.urlsplit(url).scheme.lower() not in ("http", "https"):
+                raise error.URLError(f"redirection to {url!r} is not allowed")
+        else:
+            raise error.URLError(f"too many redirects (last location: {url})")
+    except (OSError, http.client.HTTPException) as exc:
+        LOGGER.error("Failed to fetch %s: %s", requested_url, exc)
+        return b""
+
+    if status == 304 and cached:
+        LOGGER.debug("%s not modified; using cached response", requested_url)
+        return cached[0]
+
+    if status >= 400:
+        LOGGER.error("Failed to fetch %s: HTTP %s", requested_url, status)
+        return b""
+
     try:
-        LOGGER.debug("Fetching URL %s", url)
-        with request.urlopen(url, timeout=timeout) as response:
-            charset = response.headers.get_content_charset() or "utf-8"
-            body = response.read()
-            return body.decode(charset)
-    except error.URLError as exc:
-        LOGGER.error("Failed to fetch %s: %s", url, exc)
-        return ""
+        body = _decompress(body, headers.get("Content-Encoding", ""))
+    except (OSError, EOFError, zlib.error) as exc:
+        LOGGER.error("Failed to decompress %s: %s", requested_url, exc)
+        return b""
+
+    body = _to_utf8(body, headers.get_content_charset() or "utf-8", url)
+    if cache_dir:
+        _write_cache(cache_dir, requested_url, body, headers)
+    return body
+
+
+def _cache_paths(cache_dir: pathlib.Path, url: str) -> Tuple[pathlib.Path, pathlib.Path]:
+    """Return the body and metadata cache files for ``url``."""
+
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.bin", cache_dir / f"{digest}.meta.json"
+
+
+def _read_cache(cache_dir: pathlib.Path, url: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+    """Return the cached body and validators for ``url``, if any."""
+
+    body_path, meta_path = _cache_paths(cache_dir, url)
+    try:
+        return body_path.read_bytes(), json.loads(meta_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
 
+def _conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """Translate cached validators into conditional request headers."""
 
-def parse_sample_json(response_text: str, source: SourceConfig) -> Iterable[Dict[str, Any]]:
+    headers = {}
+    if validators.get("ETag"):
+        headers["If-None-Match"] = validators["ETag"]
+    if validators.get("Last-Modified"):
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    return headers
+
+
+def _write_cache(cache_dir: pathlib.Path, url: str, body: bytes, headers: Message) -> None:
+    """Cache ``body`` for ``url`` when the response can be revalidated later.
+
+    Responses without an ``ETag`` or ``Last-Modified`` header evict any
+    existing cache entry for ``url``.
+    """
+
+    validators = {name: headers[name] for name in ("ETag", "Last-Modified") if headers.get(name)}
+    body_path, meta_path = _cache_paths(cache_dir, url)
+    if not validators:
+        # Drop any earlier entry so later requests stop sending validators for
+        # a body that no longer matches. Metadata goes first: without it the
+        # body is never used.
+        try:
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+        except OSError as exc:
+            LOGGER.warning("Could not remove stale cache entry for %s: %s", url, exc)
+        return
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for path, content in ((body_path, body), (meta_path, json.dumps(validators).encode("utf-8"))):
+            _replace_atomically(path, content)
+    except OSError as exc:
+        LOGGER.warning("Could not cache response for %s: %s", url, exc)
+
+
+def _replace_atomically(path: pathlib.Path, content: bytes) -> None:
+    """Write ``content`` to a temporary file and move it over ``path``."""
+
+    fd, name = tempfile.mkstemp(dir=path.parent)
+    temporary = pathlib.Path(name)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def _decompress(body: bytes, content_encoding: str) -> bytes:
+    """Undo the ``Content-Encoding`` the server applied to ``body``."""
+
+    encoding = content_encoding.strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        # Servers disagree on whether "deflate" bodies carry a zlib header.
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _to_utf8(body: bytes, charset: str, url: str) -> bytes:
+    """Transcode ``body`` to UTF-8 when the server declared another charset."""
+
+    if charset.lower().replace("_", "-") in ("utf-8", "utf8"):
+        return body
+    try:
+        return body.decode(charset).encode("utf-8")
+    except (LookupError, UnicodeDecodeError) as exc:
+        LOGGER.warning("Could not decode %s as %s: %s", url, charset, exc)
+        return body
+
+
+def parse_sample_json(response_body: bytes, source: SourceConfig) -> List[Dict[str, Any]]:
     """Parse a JSON feed containing startup deals.
 
     The parser expects the remote endpoint to return a JSON array of objects.
@@ -81,12 +383,14 @@ def parse_sample_json(response_text: str, source: SourceConfig) -> Iterable[Dict
     to make it easy to copy when adding new sources.
     """
 
-    if not response_text.strip():
+    if not response_body.strip():
         return []
 
     try:
-        payload = json.loads(response_text)
-    except json.JSONDecodeError as exc:
+        payload = _loads(response_body)
+    except ValueError as exc:
+        # Covers both JSONDecodeError and the UnicodeDecodeError raised by the
+        # stdlib parser for bodies that are not valid UTF-8.
         LOGGER.error("Source %s did not return valid JSON: %s", source.name, exc)
         return []
 
@@ -94,16 +398,25 @@ def parse_sample_json(response_text: str, source: SourceConfig) -> Iterable[Dict
         LOGGER.warning("Source %s returned a non-list payload: %r", source.name, type(payload))
         return []
 
-    for raw_entry in payload:
-        if not isinstance(raw_entry, dict):
-            LOGGER.debug("Skipping non-dict entry in %s: %r", source.name, raw_entry)
-            continue
-
-        # The example feed might provide either the Spanish field names used by
-        # the downstream sheet or the original English ones (``name``,
-        # ``description``...).  We normalise here so the rest of the pipeline can
-        # rely on a consistent schema.
-        yield {
+    try:
+        return _sample_rows(payload, source.name)
+    except AttributeError:
+        # Cold path: only taken when the feed contains non-object entries.
+        entries = [raw_entry for raw_entry in payload if isinstance(raw_entry, dict)]
+        LOGGER.debug("Skipping %s non-dict entries in %s", len(payload) - len(entries), source.name)
+        return _sample_rows(entries, source.name)
+
+
+def _sample_rows(entries: List[Dict[str, Any]], source_name: str) -> List[Dict[str, Any]]:
+    """Map raw feed objects to the :func:`normalise_deal` input schema in one pass."""
+
+    # The example feed might provide either the Spanish field names used by
+    # the downstream sheet or the original English ones (``name``,
+    # ``description``...).  We normalise here so the rest of the pipeline can
+    # rely on a consistent schema. The ``or`` chains short-circuit, so the
+    # fallback keys are only looked up when the preferred one is missing.
+    return [
+        {
             "id": raw_entry.get("id") or raw_entry.get("uuid") or "",
             "nombre": raw_entry.get("nombre") or raw_entry.get("name", ""),
             "sector": raw_entry.get("sector", ""),
@@ -124,11 +437,13 @@ def parse_sample_json(response_text: str, source: SourceConfig) -> Iterable[Dict
             "modelo_digital": raw_entry.get("modelo_digital") or raw_entry.get("digital_model", ""),
             "indicador_sostenibilidad": raw_entry.get("indicador_sostenibilidad")
             or raw_entry.get("sustainability_indicator", ""),
-            "fuente_datos": raw_entry.get("fuente_datos") or source.name,
+            "fuente_datos": raw_entry.get("fuente_datos") or source_name,
         }
+        for raw_entry in entries
+    ]
 
 
-OUTPUT_FIELDS = [
+OUTPUT_FIELDS: Tuple[str, ...] = (
     "id",
     "nombre",
     "sector",
@@ -147,7 +462,14 @@ OUTPUT_FIELDS = [
     "indicador_sostenibilidad",
     "fuente_datos",
     "scraped_at",
-]
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_tags(value: str) -> Tuple[str, ...]:
+    """Split a comma separated tag string; cached as feeds repeat the same tags."""
+
+    return tuple(tag for tag in map(str.strip, value.split(",")) if tag)
 
 
 def _coerce_tags(value: Any) -> List[str]:
@@ -156,7 +478,7 @@ def _coerce_tags(value: Any) -> List[str]:
     if not value:
         return []
     if isinstance(value, str):
-        return [tag.strip() for tag in value.split(",") if tag.strip()]
+        return list(_split_tags(value))
     if isinstance(value, (list, tuple, set)):
         normalised: List[str] = []
         for item in value:
@@ -167,43 +489,49 @@ def _coerce_tags(value: Any) -> List[str]:
     return [str(value).strip()]
 
 
-def _coerce_string(value: Any) -> str:
-    """Return a trimmed string if the input is truthy text, otherwise an empty string."""
+# Coercion applied to each output field by the generated :func:`normalise_deal`.
+# ``{key}`` is replaced with the quoted field name. Text fields keep trimmed
+# strings and turn anything else into ``""``. ``str.strip`` is called
+# unconditionally: it returns the original object for already clean text, and
+# any Python-level "needs stripping?" pre-check costs more than it saves.
+_TEXT_EXPRESSION = '(_v.strip() if isinstance(_v := raw_deal.get({key}), str) else "")'
+_FIELD_EXPRESSIONS: Dict[str, str] = {
+    "tags": "_coerce_tags(raw_deal.get({key}))",
+    "fuente_datos": _TEXT_EXPRESSION + ' or "unknown"',
+    "scraped_at": "scraped_at",
+}
 
-    if not value or not isinstance(value, str):
-        return ""
-    return value.strip()
 
+def _build_normaliser() -> Callable[..., Dict[str, Any]]:
+    """Generate :func:`normalise_deal` specialised to ``OUTPUT_FIELDS``.
 
-def normalise_deal(raw_deal: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalise parsed data to the Vaireo dealflow schema."""
+    The generated function is a single dict literal with every coercion
+    inlined, so normalising a deal costs no helper call or loop per field.
+    """
 
-    normalised: Dict[str, Any] = {
-        "id": _coerce_string(raw_deal.get("id")),
-        "nombre": _coerce_string(raw_deal.get("nombre")),
-        "sector": _coerce_string(raw_deal.get("sector")),
-        "sub_sector": _coerce_string(raw_deal.get("sub_sector")),
-        "pais": _coerce_string(raw_deal.get("pais")),
-        "estado": _coerce_string(raw_deal.get("estado")),
-        "descripcion": _coerce_string(raw_deal.get("descripcion")),
-        "website": _coerce_string(raw_deal.get("website")),
-        "tags": _coerce_tags(raw_deal.get("tags")),
-        "tecnologia_principal": _coerce_string(raw_deal.get("tecnologia_principal")),
-        "eficiencia_hidrica": _coerce_string(raw_deal.get("eficiencia_hidrica")),
-        "tecnologias_regenerativas": _coerce_string(raw_deal.get("tecnologias_regenerativas")),
-        "impacto_medioambiental": _coerce_string(raw_deal.get("impacto_medioambiental")),
-        "impacto_social": _coerce_string(raw_deal.get("impacto_social")),
-        "modelo_digital": _coerce_string(raw_deal.get("modelo_digital")),
-        "indicador_sostenibilidad": _coerce_string(raw_deal.get("indicador_sostenibilidad")),
-        "fuente_datos": _coerce_string(raw_deal.get("fuente_datos")) or "unknown",
-        "scraped_at": int(time.time()),
-    }
+    entries = "".join(
+        f"        {field!r}: {_FIELD_EXPRESSIONS.get(field, _TEXT_EXPRESSION).format(key=repr(field))},\n"
+        for field in OUTPUT_FIELDS
+    )
+    source = (
+        "def normalise_deal(raw_deal, *, scraped_at=None):\n"
+        "    if scraped_at is None:\n"
+        "        scraped_at = int(_time())\n"
+        f"    return {{\n{entries}    }}\n"
+    )
+    namespace: Dict[str, Any] = {"__name__": __name__, "_coerce_tags": _coerce_tags, "_time": time.time}
+    exec(compile(source, "<normalise_deal>", "exec"), namespace)
+
+    normaliser = namespace["normalise_deal"]
+    normaliser.__doc__ = (
+        "Normalise parsed data to the Vaireo dealflow schema.\n\n"
+        "``scraped_at`` defaults to the current epoch time; pass it explicitly to\n"
+        "share a single timestamp across a batch of deals."
+    )
+    return normaliser
 
-    for field in OUTPUT_FIELDS:
-        if field not in normalised:
-            normalised[field] = ""
 
-    return normalised
+normalise_deal = _build_normaliser()
 
 
 DEFAULT_SOURCES: Dict[str, SourceConfig] = {
@@ -220,14 +548,74 @@ DEFAULT_SOURCES: Dict[str, SourceConfig] = {
 }
 
 
-def persist_to_json(deals: Iterable[Dict[str, Any]], output_path: pathlib.Path) -> None:
-    """Write normalised deal data to a JSON file."""
+def default_cache_dir() -> pathlib.Path:
+    """Return the HTTP response cache directory used by the command line interface.
+
+    Resolved lazily because :meth:`pathlib.Path.home` raises ``RuntimeError``
+    when no home directory can be determined.
+    """
+
+    return pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache") / "vaireo"
+
+
+OUTPUT_FORMATS = ("json", "ndjson")
 
-    records = list(deals)
+
+def persist_to_json(
+    deals: Iterable[Dict[str, Any]], output_path: pathlib.Path, *, output_format: str = "json"
+) -> None:
+    """Write normalised deal data to a JSON file.
+
+    ``output_format`` selects between an indented JSON array (``"json"``) and
+    newline-delimited JSON with one compact record per line (``"ndjson"``).
+    Records are serialised and written one at a time, so ``deals`` may be a
+    generator and is never materialised as a whole.
+    """
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format {output_format!r}; expected one of {OUTPUT_FORMATS}")
+
+    count = 0
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(records, handle, indent=2, ensure_ascii=False)
-    LOGGER.info("Persisted %s deals to %s", len(records), output_path.resolve())
+    with output_path.open("wb") as handle:
+        if output_format == "ndjson":
+            for count, deal in enumerate(deals, start=1):
+                handle.write(_dumps_line(deal))
+        else:
+            # Match ``json.dump(records, indent=2)``: each record is indented
+            # one level inside the array. Serialised JSON never contains raw
+            # newlines inside strings, so re-indenting line breaks is safe.
+            handle.write(b"[")
+            for count, deal in enumerate(deals, start=1):
+                handle.write(b"\n  " if count == 1 else b",\n  ")
+                handle.write(_dumps(deal).replace(b"\n", b"\n  "))
+            handle.write(b"\n]" if count else b"]")
+    LOGGER.info("Persisted %s deals to %s", count, output_path.resolve())
+
+
+# Upper bound on the number of sources fetched at the same time.
+_MAX_CONCURRENT_FETCHES = 16
+
+
+def _fetch_all(
+    sources: List[SourceConfig], *, timeout: int, cache_dir: Optional[pathlib.Path]
+) -> List[bytes]:
+    """Fetch every source concurrently, returning bodies in source order.
+
+    :func:`fetch_url` releases the GIL while waiting on the network, so a small
+    thread pool makes the total wall time close to that of the slowest source
+    rather than the sum of all of them.
+    """
+
+    if not sources:
+        return []
+
+    def fetch(source: SourceConfig) -> bytes:
+        LOGGER.info("Scraping %s (%s)", source.name, source.url)
+        return fetch_url(source.url, timeout=timeout, cache_dir=cache_dir)
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_FETCHES, len(sources))) as executor:
+        return list(executor.map(fetch, sources))
 
 
 def run_workflow(
@@ -236,24 +624,33 @@ def run_workflow(
     timeout: int,
     output: Optional[pathlib.Path],
     dry_run: bool,
+    cache_dir: Optional[pathlib.Path] = None,
+    output_format: str = "json",
 ) -> List[Dict[str, Any]]:
-    """Execute the end-to-end scraping workflow for the provided sources."""
+    """Execute the end-to-end scraping workflow for the provided sources.
+
+    Sources are fetched concurrently; parsing and normalisation then run
+    sequentially in source order. See :func:`fetch_url` for ``cache_dir`` and
+    :func:`persist_to_json` for ``output_format``.
+    """
 
+    sources = list(sources)
+    bodies = _fetch_all(sources, timeout=timeout, cache_dir=cache_dir)
     collected: List[Dict[str, Any]] = []
 
-    for source in sources:
-        LOGGER.info("Scraping %s (%s)", source.name, source.url)
-        response_text = fetch_url(source.url, timeout=timeout)
-        if not response_text:
+    for source, response_body in zip(sources, bodies):
+        if not response_body:
             LOGGER.warning("No response received from %s", source.name)
             continue
 
-        for raw_deal in source.parser(response_text, source):
-            normalised = normalise_deal(raw_deal)
-            collected.append(normalised)
+        # Deals from one source share a timestamp, so the clock is read once
+        # per source rather than once per deal.
+        scraped_at = int(time.time())
+        for raw_deal in source.parser(response_body, source):
+            collected.append(normalise_deal(raw_deal, scraped_at=scraped_at))
 
     if output and not dry_run:
-        persist_to_json(collected, output)
+        persist_to_json(collected, output, output_format=output_format)
     elif dry_run:
         LOGGER.info("Dry run enabled; skipping persistence. %s deals collected.", len(collected))
 
@@ -286,11 +683,25 @@ def build_parser() -> argparse.ArgumentParser:
         default=pathlib.Path("dealflow.json"),
         help="Path to write the collected dealflow JSON payload.",
     )
+    parser.add_argument(
+        "--output-format",
+        default="json",
+        choices=OUTPUT_FORMATS,
+        help="Write an indented JSON array (json) or one record per line (ndjson).",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Collect data without writing it to disk.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Always download sources instead of revalidating responses cached in "
+            "$XDG_CACHE_HOME/vaireo (default: ~/.cache/vaireo)."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -306,15 +717,16 @@ def main(argv: Optional[List[str]] = None) -> int:
     The orchestration process performs the following steps:
 
     1. Parse CLI arguments and select the sources to scrape.
-    2. Perform HTTP requests to fetch each source's payload.
+    2. Perform HTTP requests to fetch each source's payload concurrently.
     3. Delegate response parsing to the source-specific parser functions.
     4. Normalise the parsed data to a shared schema for downstream consumers.
     5. Persist the results to JSON (unless ``--dry-run`` is enabled).
 
     To extend the scraper with a new source:
 
-    * Write a parser function that converts the raw HTTP response to the
-      dictionary format expected by :func:`normalise_deal`.
+    * Write a parser function that converts the raw HTTP response body (UTF-8
+      encoded ``bytes``) to the dictionary format expected by
+      :func:`normalise_deal`.
     * Create a :class:`SourceConfig` entry referencing the parser and URL.
     * Add the new configuration to ``DEFAULT_SOURCES`` (or surface it via your
       preferred configuration mechanism).
@@ -339,7 +751,14 @@ def main(argv: Optional[List[str]] = None) -> int:
         LOGGER.error("No valid sources specified. Exiting without scraping.")
         return 1
 
-    run_workflow(selected_sources, timeout=args.timeout, output=args.output, dry_run=args.dry_run)
+    run_workflow(
+        selected_sources,
+        timeout=args.timeout,
+        output=args.output,
+        dry_run=args.dry_run,
+        cache_dir=None if args.no_cache else default_cache_dir(),
+        output_format=args.output_format,
+    )
     return 0
 
 
@@ -1,13 +1,31 @@
-"""Tests for the scraper normalisation helpers."""
+"""Tests for the scraper fetching, parsing, normalisation and persistence helpers."""
 
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
 from pathlib import Path
 import sys
+import threading
+from typing import Iterator, List
+from urllib.parse import urlsplit
+
+import pytest
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from scraper import normalise_deal
+import scraper
+from scraper import (
+    OUTPUT_FIELDS,
+    SourceConfig,
+    fetch_url,
+    normalise_deal,
+    parse_sample_json,
+    persist_to_json,
+    run_workflow,
+)
 
 
 def test_normalise_deal_handles_non_string_values() -> None:
@@ -30,3 +48,275 @@ def test_normalise_deal_handles_non_string_values() -> None:
     assert normalised["impacto_social"] == ""
     assert normalised["fuente_datos"] == "unknown"
     assert normalised["tags"] == ["Agtech", "42"]
+
+
+def test_normalise_deal_emits_every_output_field() -> None:
+    """The normaliser output must stay in sync with ``OUTPUT_FIELDS``."""
+
+    assert tuple(normalise_deal({})) == OUTPUT_FIELDS
+
+
+def test_normalise_deal_uses_given_scraped_at() -> None:
+    """An explicit ``scraped_at`` is used instead of reading the clock."""
+
+    assert normalise_deal({}, scraped_at=123)["scraped_at"] == 123
+
+
+def test_run_workflow_shares_one_timestamp_per_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """All deals from one source carry the same ``scraped_at`` value."""
+
+    # Every clock read in run_workflow returns a new value.
+    monkeypatch.setattr(scraper.time, "time", itertools.count(1000).__next__)
+    sources = []
+    for name in ("Feed A", "Feed B"):
+        feed = tmp_path / f"{name}.json"
+        feed.write_bytes(b'[{"name": "Uno"}, {"name": "Dos"}, {"name": "Tres"}]')
+        sources.append(SourceConfig(name=name, url=feed.as_uri(), parser=parse_sample_json))
+
+    deals = run_workflow(sources, timeout=5, output=None, dry_run=True)
+
+    timestamps = {
+        name: {deal["scraped_at"] for deal in deals if deal["fuente_datos"] == name} for name in ("Feed A", "Feed B")
+    }
+    assert len(deals) == 6
+    # One value per source, read from the patched clock by run_workflow rather
+    # than by normalise_deal itself (which would yield the real epoch time).
+    assert all(len(values) == 1 and max(values) < 2000 for values in timestamps.values())
+
+
+def test_parse_sample_json_accepts_raw_bytes() -> None:
+    """Parsers receive the undecoded response body from ``fetch_url``."""
+
+    source = SourceConfig(name="Test feed", url="https://example.com", parser=parse_sample_json)
+    body = '[{"name": "Aguas Claras", "country": "España"}, "not-a-dict"]'.encode("utf-8")
+
+    deals = list(parse_sample_json(body, source))
+
+    assert len(deals) == 1
+    assert deals[0]["nombre"] == "Aguas Claras"
+    assert deals[0]["pais"] == "España"
+    assert deals[0]["fuente_datos"] == "Test feed"
+
+
+def test_parse_sample_json_skips_invalid_utf8_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The stdlib parser's UnicodeDecodeError is handled like invalid JSON."""
+
+    monkeypatch.setattr(scraper, "_loads", json.loads)
+    source = SourceConfig(name="Test feed", url="https://example.com", parser=parse_sample_json)
+
+    assert parse_sample_json(b'["\xff"]', source) == []
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: List[int] = []
+    statuses: List[int] = []
+    file_location = ""
+    send_etag = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self.client_ports.append(self.client_address[1])
+        # Proxied requests carry an absolute URL rather than just the path.
+        path = urlsplit(self.path).path
+        if path == "/old":
+            self._reply(301, Location="/deals.json")
+            return
+        if path == "/to-file":
+            self._reply(302, Location=self.file_location)
+            return
+        if path != "/deals.json":
+            self.statuses.append(404)
+            self.send_error(404)
+            return
+        if self.send_etag and self.headers.get("If-None-Match") == '"v1"':
+            self._reply(304, ETag='"v1"')
+            return
+        body = b'[{"name": "Aguas Claras"}]'
+        headers = {"Content-Type": "application/json"}
+        if self.send_etag:
+            headers["ETag"] = '"v1"'
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        self._reply(200, body, **headers)
+        if urlsplit(self.path).query == "drop":
+            # Close the socket without announcing it, as an idle keep-alive
+            # timeout on the server would.
+            self.close_connection = True
+
+    def _reply(self, status: int, body: bytes = b"", **headers: str) -> None:
+        self.statuses.append(status)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def feed_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Serve :class:`_FeedHandler` on localhost and yield its base URL."""
+
+    for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    _FeedHandler.client_ports = []
+    _FeedHandler.statuses = []
+    _FeedHandler.send_etag = True
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch_url_reuses_connections_and_follows_redirects(feed_server: str) -> None:
+    """Requests to the same host share one keep-alive connection.
+
+    The handler gzips its response when asked to, so the assertions also cover
+    transparent decompression.
+    """
+
+    assert fetch_url(f"{feed_server}/deals.json") == b'[{"name": "Aguas Claras"}]'
+    assert fetch_url(f"{feed_server}/old") == b'[{"name": "Aguas Claras"}]'
+    assert fetch_url(f"{feed_server}/missing") == b""
+
+    assert _FeedHandler.statuses == [200, 301, 200, 404]
+    assert len(set(_FeedHandler.client_ports)) == 1
+
+
+def test_fetch_url_revalidates_cached_responses(feed_server: str, tmp_path: Path) -> None:
+    """Cached bodies are returned when the server answers 304 Not Modified."""
+
+    url = f"{feed_server}/deals.json"
+
+    assert fetch_url(url, cache_dir=tmp_path) == b'[{"name": "Aguas Claras"}]'
+    assert fetch_url(url, cache_dir=tmp_path) == b'[{"name": "Aguas Claras"}]'
+    assert fetch_url(url) == b'[{"name": "Aguas Claras"}]'
+
+    assert _FeedHandler.statuses == [200, 304, 200]
+
+
+def test_fetch_url_cleans_up_when_caching_fails(
+    feed_server: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed cache write leaves no temporary files and still returns the body."""
+
+    def fail_replace(src: object, dst: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(scraper.os, "replace", fail_replace)
+
+    assert fetch_url(f"{feed_server}/deals.json", cache_dir=tmp_path) == b'[{"name": "Aguas Claras"}]'
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_url_evicts_cache_when_validators_disappear(feed_server: str, tmp_path: Path) -> None:
+    """A 200 without ``ETag``/``Last-Modified`` removes the stale cache entry."""
+
+    url = f"{feed_server}/deals.json"
+    assert fetch_url(url, cache_dir=tmp_path) == b'[{"name": "Aguas Claras"}]'
+    assert len(list(tmp_path.iterdir())) == 2
+
+    _FeedHandler.send_etag = False
+    # The server ignores the stale If-None-Match and answers 200 without an
+    # ETag; the cache entry must go so the next request is unconditional.
+    assert fetch_url(url, cache_dir=tmp_path) == b'[{"name": "Aguas Claras"}]'
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_url_retries_when_pooled_connection_was_closed(feed_server: str) -> None:
+    """A kept-alive connection closed by the server is retried on a new one."""
+
+    assert fetch_url(f"{feed_server}/deals.json?drop") == b'[{"name": "Aguas Claras"}]'
+    assert fetch_url(f"{feed_server}/deals.json") == b'[{"name": "Aguas Claras"}]'
+
+    assert _FeedHandler.statuses == [200, 200]
+    assert len(set(_FeedHandler.client_ports)) == 2
+
+
+@pytest.mark.parametrize("proxied", [False, True])
+def test_fetch_url_refuses_redirects_to_local_files(
+    feed_server: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, proxied: bool
+) -> None:
+    """Remote sources cannot redirect the scraper to ``file://`` URLs."""
+
+    secret = tmp_path / "secret.json"
+    secret.write_bytes(b'[{"name": "Secret"}]')
+    _FeedHandler.file_location = secret.as_uri()
+    url = f"{feed_server}/to-file"
+    if proxied:
+        monkeypatch.setenv("http_proxy", feed_server)
+        url = "http://deals.example.invalid/to-file"
+
+    assert fetch_url(url) == b""
+
+
+def test_fetch_url_honours_proxy_environment(feed_server: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Hosts covered by ``http_proxy`` are requested through the proxy."""
+
+    monkeypatch.setenv("http_proxy", feed_server)
+
+    assert fetch_url("http://deals.example.invalid/deals.json") == b'[{"name": "Aguas Claras"}]'
+    assert _FeedHandler.statuses == [200]
+
+
+def test_fetch_url_reads_file_urls(tmp_path: Path) -> None:
+    """``file://`` URLs are supported for testing parsers against local files."""
+
+    feed = tmp_path / "deals.json"
+    feed.write_bytes(b'[{"name": "Aguas Claras"}]')
+
+    assert fetch_url(feed.as_uri()) == b'[{"name": "Aguas Claras"}]'
+
+
+def test_persist_to_json_streams_a_valid_array(tmp_path: Path) -> None:
+    """Records written one by one still form a single JSON array."""
+
+    deals = [normalise_deal({"nombre": "Aguas Claras", "tags": "agua, riego"}), normalise_deal({})]
+    output = tmp_path / "out" / "dealflow.json"
+
+    persist_to_json(iter(deals), output)
+    assert json.loads(output.read_text(encoding="utf-8")) == deals
+
+    persist_to_json(iter([]), output)
+    assert json.loads(output.read_text(encoding="utf-8")) == []
+
+
+@pytest.mark.parametrize("stdlib", [False, True])
+def test_persist_to_json_matches_json_dump_layout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, stdlib: bool
+) -> None:
+    """Streaming output is byte-for-byte what ``json.dump(indent=2)`` writes."""
+
+    if stdlib:
+        monkeypatch.setattr(
+            scraper, "_dumps", lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        )
+    deals = [
+        normalise_deal({"nombre": "Aguas Claras", "pais": "España", "tags": "agua, riego"}, scraped_at=1),
+        normalise_deal({}, scraped_at=1),
+    ]
+    output = tmp_path / "dealflow.json"
+
+    for records in (deals, []):
+        persist_to_json(iter(records), output)
+        assert output.read_text(encoding="utf-8") == json.dumps(records, indent=2, ensure_ascii=False)
+
+
+def test_persist_to_json_writes_ndjson(tmp_path: Path) -> None:
+    """The NDJSON format writes one compact record per line."""
+
+    deals = [normalise_deal({"nombre": "Aguas Claras", "pais": "España"}), normalise_deal({})]
+    output = tmp_path / "dealflow.ndjson"
+
+    persist_to_json(iter(deals), output, output_format="ndjson")
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == deals